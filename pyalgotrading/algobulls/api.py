@@ -2,13 +2,52 @@
 Module for handling API calls to the [AlgoBulls](https://www.algobulls.com) backend.
 """
 
-from json import JSONDecodeError
-
+import logging
+import threading
+import time
+from collections import OrderedDict
+from urllib.request import getproxies
+
+import certifi
+import orjson
 import requests
+import urllib3
 
 from .exceptions import AlgoBullsAPIBaseException, AlgoBullsAPIUnauthorizedError, AlgoBullsAPIInsufficientBalanceError, AlgoBullsAPIResourceNotFoundError, AlgoBullsAPIBadRequest, AlgoBullsAPIInternalServerErrorException, AlgoBullsAPIForbiddenError
 from ..constants import TradingType, TradingReportType
 
+logger = logging.getLogger(__name__)
+
+# HTTP status code to exception class, looked up once per response in _send_request
+_STATUS_EXC = {
+    400: AlgoBullsAPIBadRequest,
+    401: AlgoBullsAPIUnauthorizedError,
+    402: AlgoBullsAPIInsufficientBalanceError,
+    403: AlgoBullsAPIForbiddenError,
+    404: AlgoBullsAPIResourceNotFoundError,
+    500: AlgoBullsAPIInternalServerErrorException,
+}
+
+# Trading type / report type to endpoint, resolved with a single lookup per call
+_ALGOTRADE_ENDPOINT = {
+    TradingType.REALTRADING: 'v2/portfolio/strategies',
+    TradingType.PAPERTRADING: 'v2/papertrading/strategies',
+    TradingType.BACKTESTING: 'v2/backtesting/strategies',
+}
+
+# HTTP method used to register a strategy for each trading type (see __fetch_key)
+_FETCH_KEY_METHOD = {
+    TradingType.REALTRADING: 'post',
+    TradingType.PAPERTRADING: 'put',
+    TradingType.BACKTESTING: 'patch',
+}
+
+_REPORT_ENDPOINT = {
+    TradingReportType.PNL_TABLE: 'v2/user/strategy/pltable',
+    TradingReportType.STATS_TABLE: 'v2/user/strategy/statstable',
+    TradingReportType.ORDER_HISTORY: 'v2/user/strategy/orderhistory',
+}
+
 
 class AlgoBullsAPI:
     """
@@ -17,28 +56,78 @@ class AlgoBullsAPI:
     SERVER_ENDPOINT = 'https://api.algobulls.com/'
     # SERVER_ENDPOINT = 'http://127.0.0.1:8000/'
 
+    GET_CACHE_TTL = 30.0  # seconds a cached idempotent response stays fresh
+    GET_CACHE_MAX_ENTRIES = 512  # bound on cache size
+    KEY_CACHE_MAX_ENTRIES = 512  # bound on cached strategy keys per trading type
+
     def __init__(self):
         """
         Init method that is used while creating an object of this class
         """
-        self.headers = None
-        self.__key_backtesting = None  # cstc id
-        self.__key_papertrading = None  # cstc id
-        self.__key_realtrading = None  # cstc id
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        # Dedicated urllib3 pool for short hot-path requests, bypassing the requests prep/send layer.
+        # Certificate verification against the certifi bundle matches what requests does on the
+        # session path. The pool does not honor environment proxies, so when any are configured
+        # the hot-path helpers fall back to the session instead.
+        self._proxies = getproxies()
+        self._pool = urllib3.PoolManager(num_pools=4, maxsize=20, cert_reqs='CERT_REQUIRED', ca_certs=certifi.where())
+        self._key_cache_lock = threading.Lock()  # serializes key fetches so concurrent misses register a strategy only once
+
+        def _make_key_getter(trading_type):
+            # Specialized per-trading-type getter: closes over its own cache slot, so the
+            # hot path is one dict probe with no branching on trading_type. The cache is
+            # LRU-bounded so scanning a large strategy universe cannot grow it unboundedly.
+            cache = OrderedDict()
+
+            def getter(strategy_code):
+                value = cache.get(strategy_code)
+                if value is not None:
+                    try:
+                        cache.move_to_end(strategy_code)
+                    except KeyError:
+                        # a concurrent insert may have evicted the key between get and move_to_end;
+                        # the LRU ordering is advisory, so losing this recency bump is harmless
+                        pass
+                    return value
+                with self._key_cache_lock:
+                    value = cache.get(strategy_code)
+                    if value is None:
+                        value = self.__fetch_key(strategy_code=strategy_code, trading_type=trading_type)
+                        cache[strategy_code] = value
+                        if len(cache) > self.KEY_CACHE_MAX_ENTRIES:
+                            cache.popitem(last=False)
+                return value
+
+            return getter
+
+        # TradingType values are 0/1/2, so the getters live in a tuple indexed by member value
+        self._key_getters = tuple(_make_key_getter(trading_type) for trading_type in sorted(TradingType, key=lambda trading_type: trading_type.value))
+        self._get_cache = {}  # (endpoint, params) -> (timestamp, response)
 
     def set_access_token(self, access_token: str):
         """
-        Sets access token to the header attribute, which is needed for APIs requiring authorization
+        Sets access token on the underlying session, which is needed for APIs requiring authorization
         Package for interacting with AlgoBulls Algorithmic Trading Platform (https://www.algobulls.com)
 
         Args:
             access_token: Access token generated by logging to the URL given by the `get_authorization_url()` method
         """
-        self.headers = {
+        self._session.headers.update({
             'Authorization': f'{access_token}'
-        }
+        })
+        self._pool.headers['Authorization'] = f'{access_token}'
+
+    def close(self):
+        """
+        Close the underlying session and pools, releasing their connections
+        """
+        self._session.close()
+        self._pool.clear()
 
-    def _send_request(self, method: str = 'get', endpoint: str = '', base_url: str = SERVER_ENDPOINT, params: [str, dict] = None, json_data: [str, dict] = None, requires_authorization: bool = True) -> dict:
+    def _send_request(self, method: str = 'get', endpoint: str = '', base_url: str = SERVER_ENDPOINT, params: dict = None, json_data: dict = None, requires_authorization: bool = True) -> dict:
         """
         Send the request to the platform
         Args:
@@ -52,73 +141,137 @@ class AlgoBullsAPI:
         Returns:
             request status
         """
-        url = f'{base_url}{endpoint}'
-        headers = self.headers if requires_authorization else None
-        response = requests.request(method=method, headers=headers, url=url, params=params, json=json_data)
+        url = base_url + endpoint
+        # Session headers carry the auth token; a None-valued header tells requests to drop it for unauthorized endpoints
+        headers = {} if requires_authorization else {'Authorization': None}
+        data = None
+        if json_data is not None:
+            # Encode the body with orjson instead of letting requests fall back to stdlib json
+            data = orjson.dumps(json_data)
+            headers['Content-Type'] = 'application/json'
+        response = self._session.request(method=method, headers=headers or None, url=url, params=params, data=data)
+        return self._handle_response(method=method, url=url, response=response)
+
+    def _get(self, endpoint: str, params: dict = None, requires_authorization: bool = True) -> dict:
+        """
+        Fast path for GET requests: one monomorphic session call, no body handling
+        """
+        url = self.SERVER_ENDPOINT + endpoint
+        headers = None if requires_authorization else {'Authorization': None}
+        response = self._session.get(url, params=params, headers=headers)
+        return self._handle_response(method='get', url=url, response=response)
+
+    def _post(self, endpoint: str, json_data: dict, method: str = 'post') -> dict:
+        """
+        Fast path for requests with a JSON body (post/put/patch): body encoded once with orjson
+        """
+        url = self.SERVER_ENDPOINT + endpoint
+        response = self._session.request(method=method, url=url, data=orjson.dumps(json_data), headers={'Content-Type': 'application/json'})
+        return self._handle_response(method=method, url=url, response=response)
 
+    def _handle_response(self, method: str, url: str, response) -> dict:
+        """
+        Parse a platform response, returning the JSON body on success and raising the mapped exception otherwise
+        """
+        status_code = response.status_code
+        if status_code == 200:
+            return orjson.loads(response.content)
+
+        # Error path: bodies may not be JSON (e.g. an HTML error page), so fall back to plain text
         try:
-            response_json = response.json()
-        except JSONDecodeError:
-            response_json = str(response)
-
-        if response.status_code == 200:
-            response_json = response.json()
-            return response_json
-        elif response.status_code == 400:
-            raise AlgoBullsAPIBadRequest(method=method, url=url, response=response_json)
-        elif response.status_code == 401:
-            raise AlgoBullsAPIUnauthorizedError(method=method, url=url, response=response_json)
-            # try:
-            #     raise AlgoBullsAPIUnauthorizedError(method=method, url=url, response=response_json)
-            # except AlgoBullsAPIUnauthorizedError as ex:
-            #     print(f'{ex.get_error_type()}. {ex.response}')
-        elif response.status_code == 402:
-            raise AlgoBullsAPIInsufficientBalanceError(method=method, url=url, response=response_json)
-        elif response.status_code == 403:
-            raise AlgoBullsAPIForbiddenError(method=method, url=url, response=response_json)
-        elif response.status_code == 404:
-            raise AlgoBullsAPIResourceNotFoundError(method=method, url=url, response=response_json)
-        elif response.status_code == 500:
-            raise AlgoBullsAPIInternalServerErrorException(method=method, url=url, response=response_json)
+            response_json = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            response_json = response.text
+
+        exception_class = _STATUS_EXC.get(status_code, AlgoBullsAPIBaseException)
+        raise exception_class(method=method, url=url, response=response_json)
+
+    def _fast_get(self, endpoint: str, fields: dict = None) -> dict:
+        """
+        Hot-path GET straight through the urllib3 pool, skipping the requests prep/send machinery
+        Used by polling endpoints whose short responses are dominated by per-call Python overhead
+        """
+        if self._proxies:
+            return self._get(endpoint=endpoint, params=fields)
+        url = self.SERVER_ENDPOINT + endpoint
+        response = self._pool.request('GET', url, fields=fields)
+        if response.status == 200:
+            return orjson.loads(response.data)
+        self._raise_for_status(method='get', url=url, response=response)
+
+    def _fast_post(self, endpoint: str, json_data: dict) -> dict:
+        """
+        Hot-path POST straight through the urllib3 pool, body encoded once with orjson
+        """
+        if self._proxies:
+            return self._post(endpoint=endpoint, json_data=json_data)
+        url = self.SERVER_ENDPOINT + endpoint
+        headers = dict(self._pool.headers)
+        headers['Content-Type'] = 'application/json'
+        response = self._pool.request('POST', url, body=orjson.dumps(json_data), headers=headers)
+        if response.status == 200:
+            return orjson.loads(response.data)
+        self._raise_for_status(method='post', url=url, response=response)
+
+    def _raise_for_status(self, method: str, url: str, response):
+        """
+        Raise the mapped exception for a non-200 urllib3 response
+        """
+        try:
+            response_json = orjson.loads(response.data)
+        except orjson.JSONDecodeError:
+            response_json = response.data.decode(errors='replace')
+        exception_class = _STATUS_EXC.get(response.status, AlgoBullsAPIBaseException)
+        raise exception_class(method=method, url=url, response=response_json)
+
+    def _send_cached_request(self, method: str, endpoint: str, params: dict = None, requires_authorization: bool = True) -> dict:
+        """
+        Send an idempotent request through a short-lived memoization cache keyed by endpoint and params
+        Repeated identical calls within GET_CACHE_TTL seconds are served from the cache without a network round trip
+        """
+        key = (endpoint, tuple(sorted(params.items())) if params else ())
+        now = time.monotonic()
+        hit = self._get_cache.get(key)
+        if hit is not None and now - hit[0] < self.GET_CACHE_TTL:
+            return hit[1]
+        if method == 'get':
+            response = self._get(endpoint=endpoint, params=params, requires_authorization=requires_authorization)
         else:
-            response.raw.decode_content = True
-            raise AlgoBullsAPIBaseException(method=method, url=url, response=response_json)
+            response = self._send_request(method=method, endpoint=endpoint, params=params, requires_authorization=requires_authorization)
+        self._get_cache[key] = (now, response)
+        if len(self._get_cache) > self.GET_CACHE_MAX_ENTRIES:
+            self._get_cache.pop(next(iter(self._get_cache)))
+        return response
+
+    def invalidate_cache(self):
+        """
+        Drop all cached idempotent responses
+        Called after mutating operations like `create_strategy` / `update_strategy` so subsequent reads see fresh data
+        """
+        self._get_cache.clear()
 
     def __fetch_key(self, strategy_code, trading_type):
         # Add strategy to backtesting
-        endpoint = f'v2/portfolio/strategy'
-        json_data = {'strategyId': strategy_code, 'tradingType': trading_type.value}
+        endpoint = 'v2/portfolio/strategy'
+        method = _FETCH_KEY_METHOD.get(trading_type)
+        if method is None:
+            raise NotImplementedError
 
         # This api fails for some weird reason
         # response = self._send_request(method='options', endpoint=endpoint, json_data=json_data)
 
-        if trading_type is TradingType.REALTRADING:
-            response = self._send_request(method='post', endpoint=endpoint, json_data=json_data)
-        elif trading_type is TradingType.PAPERTRADING:
-            response = self._send_request(method='put', endpoint=endpoint, json_data=json_data)
-        elif trading_type is TradingType.BACKTESTING:
-            response = self._send_request(method='patch', endpoint=endpoint, json_data=json_data)
-        else:
-            raise NotImplementedError
+        json_data = {'strategyId': strategy_code, 'tradingType': trading_type.value}
+        response = self._post(endpoint=endpoint, json_data=json_data, method=method)
 
         key = response.get('key')
         return key
 
     def __get_key(self, strategy_code, trading_type):
-        if trading_type is TradingType.BACKTESTING:
-            if self.__key_backtesting is None:
-                self.__key_backtesting = self.__fetch_key(strategy_code=strategy_code, trading_type=TradingType.BACKTESTING)
-            return self.__key_backtesting
-        elif trading_type is TradingType.PAPERTRADING:
-            if self.__key_papertrading is None:
-                self.__key_papertrading = self.__fetch_key(strategy_code=strategy_code, trading_type=TradingType.PAPERTRADING)
-            return self.__key_papertrading
-        elif trading_type is TradingType.REALTRADING:
-            if self.__key_realtrading is None:
-                self.__key_realtrading = self.__fetch_key(strategy_code=strategy_code, trading_type=TradingType.REALTRADING)
-            return self.__key_realtrading
-        else:
+        try:
+            getter = self._key_getters[trading_type.value]
+        except (AttributeError, IndexError, TypeError):
             raise NotImplementedError
+        return getter(strategy_code)
 
     def create_strategy(self, strategy_name: str, strategy_details: str, abc_version: str) -> dict:
         """
@@ -140,14 +293,13 @@ class AlgoBullsAPI:
         """
         try:
             json_data = {'strategyName': strategy_name, 'strategyDetails': strategy_details, 'abcVersion': abc_version}
-            endpoint = f'v2/user/strategy/build/python'
-            print(f"Uploading strategy '{strategy_name}' ...", end=' ')
-            response = self._send_request(endpoint=endpoint, method='post', json_data=json_data)
-            print('Success.')
+            endpoint = 'v2/user/strategy/build/python'
+            response = self._post(endpoint=endpoint, json_data=json_data)
+            logger.info("Uploaded strategy '%s'", strategy_name)
+            self.invalidate_cache()
             return response
         except (AlgoBullsAPIForbiddenError, AlgoBullsAPIInsufficientBalanceError) as ex:
-            print('Fail.')
-            print(f'{ex.get_error_type()}: {ex.response}')
+            logger.error('%s: %s', ex.get_error_type(), ex.response)
 
     def update_strategy(self, strategy_name: str, strategy_details: str, abc_version: str) -> dict:
         """
@@ -165,8 +317,9 @@ class AlgoBullsAPI:
             PUT v2/user/strategy/build/python
         """
         json_data = {'strategyName': strategy_name, 'strategyDetails': strategy_details, 'abcVersion': abc_version}
-        endpoint = f'v2/user/strategy/build/python'
-        response = self._send_request(endpoint=endpoint, method='put', json_data=json_data)
+        endpoint = 'v2/user/strategy/build/python'
+        response = self._post(endpoint=endpoint, json_data=json_data, method='put')
+        self.invalidate_cache()
         return response
 
     def get_all_strategies(self) -> dict:
@@ -179,8 +332,8 @@ class AlgoBullsAPI:
         Info: ENDPOINT
             `OPTIONS` v2/user/strategy/build/python
         """
-        endpoint = f'v2/user/strategy/build/python'
-        response = self._send_request(endpoint=endpoint, method='options')
+        endpoint = 'v2/user/strategy/build/python'
+        response = self._send_cached_request(method='options', endpoint=endpoint)
         return response
 
     def get_strategy_details(self, strategy_code: str) -> dict:
@@ -197,8 +350,8 @@ class AlgoBullsAPI:
             `GET` v2/user/strategy/build/python
         """
         params = {'strategyCode': strategy_code}
-        endpoint = f'v2/user/strategy/build/python'
-        response = self._send_request(endpoint=endpoint, params=params)
+        endpoint = 'v2/user/strategy/build/python'
+        response = self._send_cached_request(method='get', endpoint=endpoint, params=params)
         return response
 
     def search_instrument(self, instrument: str) -> dict:
@@ -215,8 +368,8 @@ class AlgoBullsAPI:
             `GET` v2/instrument/search
         """
         params = {'instrument': instrument}
-        endpoint = f'v2/instrument/search'
-        response = self._send_request(endpoint=endpoint, params=params, requires_authorization=False)
+        endpoint = 'v2/instrument/search'
+        response = self._send_cached_request(method='get', endpoint=endpoint, params=params, requires_authorization=False)
         return response
 
     def set_strategy_config(self, strategy_code: str, strategy_config: dict, trading_type: TradingType) -> (str, dict):
@@ -237,9 +390,8 @@ class AlgoBullsAPI:
         json_data = {**strategy_config, 'overwrite': True}
         key = self.__get_key(strategy_code=strategy_code, trading_type=trading_type)
         endpoint = f'v2/user/strategy/{key}/tweak'
-        print('Setting Strategy Config...', end=' ')
-        response = self._send_request(method='patch', endpoint=endpoint, json_data=json_data)
-        print('Success.')
+        response = self._post(endpoint=endpoint, json_data=json_data, method='patch')
+        logger.info('Set %s strategy config for %s', trading_type.name, strategy_code)
         return key, response
 
     def start_strategy_algotrading(self, strategy_code: str, trading_type: TradingType) -> dict:
@@ -249,25 +401,18 @@ class AlgoBullsAPI:
         Info: ENDPOINT
             `POST` v2/customer_strategy_algotrading
         """
-        if trading_type == TradingType.REALTRADING:
-            endpoint = 'v2/portfolio/strategies'
-        elif trading_type == TradingType.PAPERTRADING:
-            endpoint = 'v2/papertrading/strategies'
-        elif trading_type == TradingType.BACKTESTING:
-            endpoint = 'v2/backtesting/strategies'
-        else:
+        endpoint = _ALGOTRADE_ENDPOINT.get(trading_type)
+        if endpoint is None:
             raise NotImplementedError
 
         try:
             key = self.__get_key(strategy_code=strategy_code, trading_type=trading_type)
             json_data = {'method': 'update', 'newVal': 1, 'key': key, 'record': {'status': 0}}
-            print(f'Submitting {trading_type.name} job...', end=' ')
-            response = self._send_request(method='post', endpoint=endpoint, json_data=json_data)
-            print('Success.')
+            response = self._post(endpoint=endpoint, json_data=json_data)
+            logger.info('Submitted %s job for strategy %s', trading_type.name, strategy_code)
             return response
         except (AlgoBullsAPIForbiddenError, AlgoBullsAPIInsufficientBalanceError) as ex:
-            print('Fail.')
-            print(f'{ex.get_error_type()}: {ex.response}')
+            logger.error('%s: %s', ex.get_error_type(), ex.response)
 
     def stop_strategy_algotrading(self, strategy_code: str, trading_type: TradingType) -> dict:
         """
@@ -276,25 +421,18 @@ class AlgoBullsAPI:
         Info: ENDPOINT
             `POST` v1/customer_strategy_algotrading
         """
-        if trading_type == TradingType.REALTRADING:
-            endpoint = 'v2/portfolio/strategies'
-        elif trading_type == TradingType.PAPERTRADING:
-            endpoint = 'v2/papertrading/strategies'
-        elif trading_type == TradingType.BACKTESTING:
-            endpoint = 'v2/backtesting/strategies'
-        else:
+        endpoint = _ALGOTRADE_ENDPOINT.get(trading_type)
+        if endpoint is None:
             raise NotImplementedError
 
         try:
             key = self.__get_key(strategy_code=strategy_code, trading_type=trading_type)
             json_data = {'method': 'update', 'newVal': 0, 'key': key, 'record': {'status': 2}}
-            print(f'Stopping {trading_type.name} job...', end=' ')
-            response = self._send_request(method='post', endpoint=endpoint, json_data=json_data)
-            print('Success.')
+            response = self._post(endpoint=endpoint, json_data=json_data)
+            logger.info('Stopped %s job for strategy %s', trading_type.name, strategy_code)
             return response
         except (AlgoBullsAPIForbiddenError, AlgoBullsAPIInsufficientBalanceError) as ex:
-            print('Fail.')
-            print(f'{ex.get_error_type()}: {ex.response}')
+            logger.error('%s: %s', ex.get_error_type(), ex.response)
 
     def get_job_status(self, strategy_code: str, trading_type: TradingType) -> dict:
         """
@@ -313,17 +451,11 @@ class AlgoBullsAPI:
             `GET` v2/user/strategy/status
         """
         key = self.__get_key(strategy_code=strategy_code, trading_type=trading_type)
-        params = {'key': key}
-        endpoint = f'v2/user/strategy/status'
-        response = self._send_request(endpoint=endpoint, params=params)
-        return response
+        return self._fast_get(endpoint='v2/user/strategy/status', fields={'key': key})
 
     def get_logs(self, strategy_code: str, trading_type: TradingType) -> dict:
-        endpoint = 'v2/user/strategy/logs'
         key = self.__get_key(strategy_code=strategy_code, trading_type=trading_type)
-        json_data = {'key': key}
-        response = self._send_request(method='post', endpoint=endpoint, json_data=json_data)
-        return response
+        return self._fast_post(endpoint='v2/user/strategy/logs', json_data={'key': key})
 
     def get_reports(self, strategy_code: str, trading_type: TradingType, report_type: TradingReportType) -> dict:
         """
@@ -340,16 +472,11 @@ class AlgoBullsAPI:
         Info: ENDPOINT
             `GET` v1/customer_strategy_algotrading_reports
         """
-        if report_type is TradingReportType.PNL_TABLE:
-            endpoint = 'v2/user/strategy/pltable'
-        elif report_type is TradingReportType.STATS_TABLE:
-            endpoint = 'v2/user/strategy/statstable'
-        elif report_type is TradingReportType.ORDER_HISTORY:
-            endpoint = 'v2/user/strategy/orderhistory'
-        else:
+        endpoint = _REPORT_ENDPOINT.get(report_type)
+        if endpoint is None:
             raise NotImplementedError
 
         key = self.__get_key(strategy_code=strategy_code, trading_type=trading_type)
         params = {'key': key}
-        response = self._send_request(endpoint=endpoint, params=params)
+        response = self._get(endpoint=endpoint, params=params)
         return response
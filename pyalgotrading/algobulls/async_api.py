@@ -0,0 +1,171 @@
+"""
+Module for handling asynchronous API calls to the [AlgoBulls](https://www.algobulls.com) backend.
+
+Requires the optional `httpx` dependency (`pip install pyalgotrading[async]`).
+"""
+import asyncio
+
+import httpx
+import orjson
+
+from .api import AlgoBullsAPI, _STATUS_EXC, _REPORT_ENDPOINT
+from .exceptions import AlgoBullsAPIBaseException
+from ..constants import TradingType, TradingReportType
+
+
+class AsyncAlgoBullsAPI:
+    """
+    Asynchronous AlgoBulls API
+
+    Built on `httpx.AsyncClient` with HTTP/2 and connection pooling. Independent calls can be
+    overlapped with `asyncio.gather(...)` so N concurrent requests complete in roughly one
+    round-trip window instead of N sequential round trips.
+    """
+    SERVER_ENDPOINT = AlgoBullsAPI.SERVER_ENDPOINT
+
+    def __init__(self):
+        """
+        Init method that is used while creating an object of this class
+        """
+        self._client = httpx.AsyncClient(base_url=self.SERVER_ENDPOINT, http2=True, limits=httpx.Limits(max_connections=20, max_keepalive_connections=10))
+        self._key_cache = {}  # (strategy_code, trading_type) -> cstc id
+        self._key_cache_lock = asyncio.Lock()  # serializes key fetches so concurrent misses register a strategy only once
+
+    def set_access_token(self, access_token: str):
+        """
+        Sets access token on the underlying client, which is needed for APIs requiring authorization
+
+        Args:
+            access_token: Access token generated by logging to the URL given by the `get_authorization_url()` method
+        """
+        self._client.headers.update({
+            'Authorization': f'{access_token}'
+        })
+
+    async def aclose(self):
+        """
+        Close the underlying client and release its pooled connections
+        """
+        await self._client.aclose()
+
+    async def _send_request(self, method: str = 'get', endpoint: str = '', params: dict = None, json_data: dict = None) -> dict:
+        """
+        Send the request to the platform
+
+        Args:
+            method: get
+            endpoint: endpoint url
+            params: parameters
+            json_data: json data as body
+
+        Returns:
+            request status
+        """
+        data = None
+        headers = {}
+        if json_data is not None:
+            data = orjson.dumps(json_data)
+            headers['Content-Type'] = 'application/json'
+        response = await self._client.request(method, endpoint, params=params, content=data, headers=headers or None)
+
+        try:
+            response_json = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            response_json = response.text
+
+        status_code = response.status_code
+        if status_code == 200:
+            return response_json
+
+        exception_class = _STATUS_EXC.get(status_code, AlgoBullsAPIBaseException)
+        raise exception_class(method=method, url=str(response.url), response=response_json)
+
+    async def __fetch_key(self, strategy_code, trading_type):
+        endpoint = 'v2/portfolio/strategy'
+        json_data = {'strategyId': strategy_code, 'tradingType': trading_type.value}
+
+        if trading_type is TradingType.REALTRADING:
+            response = await self._send_request(method='post', endpoint=endpoint, json_data=json_data)
+        elif trading_type is TradingType.PAPERTRADING:
+            response = await self._send_request(method='put', endpoint=endpoint, json_data=json_data)
+        elif trading_type is TradingType.BACKTESTING:
+            response = await self._send_request(method='patch', endpoint=endpoint, json_data=json_data)
+        else:
+            raise NotImplementedError
+
+        key = response.get('key')
+        return key
+
+    async def __get_key(self, strategy_code, trading_type):
+        key = (strategy_code, trading_type)
+        value = self._key_cache.get(key)
+        if value is None:
+            async with self._key_cache_lock:
+                value = self._key_cache.get(key)
+                if value is None:
+                    value = await self.__fetch_key(strategy_code=strategy_code, trading_type=trading_type)
+                    self._key_cache[key] = value
+        return value
+
+    async def get_job_status(self, strategy_code: str, trading_type: TradingType) -> dict:
+        """
+        Get status for a BACKTESTING/PAPERTRADING/REALTRADING Job
+
+        Args:
+            strategy_code: Strategy code
+            trading_type: Trading type
+
+        Returns:
+            Job status
+
+        Info: ENDPOINT
+            `GET` v2/user/strategy/status
+        """
+        key = await self.__get_key(strategy_code=strategy_code, trading_type=trading_type)
+        response = await self._send_request(endpoint='v2/user/strategy/status', params={'key': key})
+        return response
+
+    async def get_logs(self, strategy_code: str, trading_type: TradingType) -> dict:
+        key = await self.__get_key(strategy_code=strategy_code, trading_type=trading_type)
+        response = await self._send_request(method='post', endpoint='v2/user/strategy/logs', json_data={'key': key})
+        return response
+
+    async def get_reports(self, strategy_code: str, trading_type: TradingType, report_type: TradingReportType) -> dict:
+        """
+        Get reports for a BACKTESTING/PAPERTRADING/REALTRADING Job
+
+        Args:
+            strategy_code: Strategy code
+            trading_type: Value of TradingType Enum
+            report_type: Value of TradingReportType Enum
+
+        Returns:
+            Report data
+        """
+        endpoint = _REPORT_ENDPOINT.get(report_type)
+        if endpoint is None:
+            raise NotImplementedError
+
+        key = await self.__get_key(strategy_code=strategy_code, trading_type=trading_type)
+        response = await self._send_request(endpoint=endpoint, params={'key': key})
+        return response
+
+    async def get_reports_bulk(self, strategy_code: str, trading_type: TradingType) -> list:
+        """
+        Fetch all three report types concurrently for a BACKTESTING/PAPERTRADING/REALTRADING Job
+
+        The three requests overlap on the pooled client, completing in one round-trip window
+        instead of three sequential round trips.
+
+        Args:
+            strategy_code: Strategy code
+            trading_type: Value of TradingType Enum
+
+        Returns:
+            [PNL_TABLE response, STATS_TABLE response, ORDER_HISTORY response]
+        """
+        return await asyncio.gather(
+            self.get_reports(strategy_code=strategy_code, trading_type=trading_type, report_type=TradingReportType.PNL_TABLE),
+            self.get_reports(strategy_code=strategy_code, trading_type=trading_type, report_type=TradingReportType.STATS_TABLE),
+            self.get_reports(strategy_code=strategy_code, trading_type=trading_type, report_type=TradingReportType.ORDER_HISTORY),
+        )
@@ -150,7 +150,10 @@ setup(
     # For an analysis of "install_requires" vs pip's requirements files see:
     # https://packaging.python.org/en/latest/requirements.html
     install_requires=['requests>=2.24.0',
-                      'pandas>=0.25.3'],
+                      'pandas>=0.25.3',
+                      'orjson>=3.0.0',
+                      'urllib3>=1.25',
+                      'certifi'],
 
     # List additional groups of dependencies here (e.g. development
     # dependencies). Users will be able to install these using the "extras"
@@ -160,10 +163,9 @@ setup(
     #
     # Similar to `install_requires` above, these must be valid existing
     # projects.
-    # extras_require={  # Optional
-    #     'dev': ['check-manifest'],
-    #     'test': ['coverage'],
-    # },
+    extras_require={  # Optional
+        'async': ['httpx[http2]>=0.16.0'],
+    },
 
     # If there are data files included in your packages that need to be
     # installed, specify them here.